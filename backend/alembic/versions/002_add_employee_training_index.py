@@ -0,0 +1,28 @@
+"""Add composite index for employee training progress lookups
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covers the (employee_id, training_module_id) filter used by the module LEFT JOIN
+    op.create_index(
+        'ix_employee_training_employee_module',
+        'employee_training',
+        ['employee_id', 'training_module_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_training_employee_module', table_name='employee_training')
@@ -0,0 +1,40 @@
+"""Add indexes on hot filter columns
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # users.email is already covered by its unique constraint
+    op.create_index('ix_users_role_active', 'users', ['role', 'is_active'])
+    
+    # Task assignments - per-employee lookups and pending counts
+    op.create_index('ix_emp_task_emp_status', 'employee_tasks', ['employee_id', 'status'])
+    op.create_index('ix_employee_tasks_status', 'employee_tasks', ['status'])
+    
+    # Documents - per-employee lookups and pending verification counts
+    op.create_index('ix_docs_emp_vstatus', 'documents', ['employee_id', 'verification_status'])
+    op.create_index('ix_documents_verification_status', 'documents', ['verification_status'])
+    
+    # Training modules - every listing filters on is_active
+    op.create_index('ix_training_modules_is_active', 'training_modules', ['is_active'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_training_modules_is_active', table_name='training_modules')
+    op.drop_index('ix_documents_verification_status', table_name='documents')
+    op.drop_index('ix_docs_emp_vstatus', table_name='documents')
+    op.drop_index('ix_employee_tasks_status', table_name='employee_tasks')
+    op.drop_index('ix_emp_task_emp_status', table_name='employee_tasks')
+    op.drop_index('ix_users_role_active', table_name='users')
@@ -0,0 +1,26 @@
+"""Add content hash to documents
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SHA-256 of the uploaded file, used to make re-uploads idempotent
+    op.add_column('documents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_documents_content_hash', 'documents', ['content_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_content_hash', table_name='documents')
+    op.drop_column('documents', 'content_hash')
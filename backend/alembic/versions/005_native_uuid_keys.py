@@ -0,0 +1,78 @@
+"""Store primary and foreign keys as native UUID
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# (table, column, referred table) - constraint names follow the PostgreSQL default
+FOREIGN_KEYS = [
+    ('tasks', 'created_by', 'users'),
+    ('employee_tasks', 'employee_id', 'users'),
+    ('employee_tasks', 'task_id', 'tasks'),
+    ('employee_tasks', 'assigned_by', 'users'),
+    ('documents', 'employee_id', 'users'),
+    ('documents', 'verified_by', 'users'),
+    ('documents', 'task_id', 'tasks'),
+    ('training_modules', 'created_by', 'users'),
+    ('employee_training', 'employee_id', 'users'),
+    ('employee_training', 'training_module_id', 'training_modules'),
+]
+
+UUID_COLUMNS = [
+    ('users', 'id'),
+    ('tasks', 'id'),
+    ('employee_tasks', 'id'),
+    ('documents', 'id'),
+    ('training_modules', 'id'),
+    ('employee_training', 'id'),
+] + [(table, column) for table, column, _ in FOREIGN_KEYS]
+
+
+def _drop_foreign_keys() -> None:
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+
+def _create_foreign_keys() -> None:
+    for table, column, referred in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referred, [column], ['id'])
+
+
+def upgrade() -> None:
+    # Foreign keys must be dropped while referenced columns change type
+    _drop_foreign_keys()
+    
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.UUID(as_uuid=False),
+            postgresql_using=f'{column}::uuid'
+        )
+    
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    _drop_foreign_keys()
+    
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(),
+            postgresql_using=f'{column}::text'
+        )
+    
+    _create_foreign_keys()
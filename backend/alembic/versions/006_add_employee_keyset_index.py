@@ -0,0 +1,28 @@
+"""Add index for keyset pagination of the employee listing
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches ORDER BY created_at DESC, id DESC under the role filter
+    op.create_index(
+        'ix_users_role_created_id',
+        'users',
+        ['role', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_created_id', table_name='users')
@@ -0,0 +1,40 @@
+"""Add indexes for keyset pagination of the task and document listings
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Match ORDER BY created_at / uploaded_at DESC, id DESC
+    op.create_index(
+        'ix_tasks_created_id',
+        'tasks',
+        [sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'ix_docs_uploaded_id',
+        'documents',
+        [sa.text('uploaded_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'ix_docs_emp_uploaded_id',
+        'documents',
+        ['employee_id', sa.text('uploaded_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_docs_emp_uploaded_id', table_name='documents')
+    op.drop_index('ix_docs_uploaded_id', table_name='documents')
+    op.drop_index('ix_tasks_created_id', table_name='tasks')
@@ -2,16 +2,20 @@
 Async authentication utilities for HR Onboarding System
 """
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Set
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import bcrypt
+from cachetools import TTLCache
+import jwt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import lambda_stmt, bindparam
 from sqlmodel import select
 from .database import get_async_session
 from .models import UserModel
-from .core.enums import UserRole
 import os
 from dotenv import load_dotenv
 
@@ -22,21 +26,106 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Decode options built once - every token must carry an expiry and a subject
+_DECODE_OPTIONS = {"verify_signature": True, "verify_aud": False, "require": ["exp", "sub"]}
+
+# Password hashing - cost is pinned to BCRYPT_ROUNDS (measure with app.utils.bcrypt_speed)
+# so hashes made with any other cost are flagged by password_needs_rehash() and rehashed on login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+_dummy_password_hash: Optional[str] = None
+
+# bcrypt runs in worker processes so login bursts use all cores instead of the event loop.
+# The default splits the cores between uvicorn workers rather than giving each all of them.
+_WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+PASSWORD_HASH_WORKERS = int(os.getenv(
+    "PASSWORD_HASH_WORKERS",
+    str(max(1, (os.cpu_count() or 1) // _WEB_CONCURRENCY))
+))
+_password_pool: Optional[ProcessPoolExecutor] = None
+_password_semaphore: Optional[asyncio.Semaphore] = None
+
+# Hot-path lookups as lambda statements - SQLAlchemy caches their construction
+# and compiled SQL by code location, so repeat calls skip both
+_active_user_by_email = lambda_stmt(
+    lambda: select(UserModel).where(UserModel.email == bindparam("email"), UserModel.is_active == True)
+)
+_active_user_by_id = lambda_stmt(
+    lambda: select(UserModel).where(UserModel.id == bindparam("user_id"), UserModel.is_active == True)
+)
 
 # JWT Bearer token
 security = HTTPBearer()
 
+# Authenticated user cache - token hash -> user column values
+# Short TTL bounds staleness; revoke_user() drops entries on account changes
+USER_CACHE_TTL_SECONDS = min(ACCESS_TOKEN_EXPIRE_MINUTES * 60, 60)
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_keys: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash (runs in the password pool via verify_password_async)"""
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Malformed hash
+        return False
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+    """Hash a password (runs in the password pool via get_password_hash_async)"""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with a different cost than BCRYPT_ROUNDS"""
+    # Format: $2b$<cost>$<salt+digest>
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+async def _run_in_password_pool(func, *args):
+    """Run a bcrypt call in the process pool, bounding queued work"""
+    global _password_pool, _password_semaphore
+    if _password_pool is None:
+        _password_pool = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+        _password_semaphore = asyncio.Semaphore(PASSWORD_HASH_WORKERS * 2)
+    
+    async with _password_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_pool, func, *args)
+
+
+def shutdown_password_pool() -> None:
+    """Stop the password hashing workers (called on app shutdown)"""
+    global _password_pool, _password_semaphore
+    if _password_pool is not None:
+        _password_pool.shutdown(wait=False, cancel_futures=True)
+        _password_pool = None
+        _password_semaphore = None
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop"""
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    return await _run_in_password_pool(get_password_hash, password)
+
+
+async def get_dummy_password_hash() -> str:
+    """
+    Hash used to spend equal verify time when the email is unknown.
+    Computed on the password pool, and warmed at startup so logins never wait on it.
+    """
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        _dummy_password_hash = await get_password_hash_async("dummy-password")
+    return _dummy_password_hash
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -55,9 +144,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 def verify_token(token: str) -> dict:
     """Verify JWT token and return payload"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options=_DECODE_OPTIONS
+        )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -65,14 +159,57 @@ def verify_token(token: str) -> dict:
         )
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Stable cache key for a token (raw tokens are never stored)"""
+    return hashlib.blake2b(token.encode(), digest_size=32).digest()
+
+
+def cache_user(token: str, user: UserModel) -> None:
+    """Store a detached snapshot of the user for the given token"""
+    key = _token_cache_key(token)
+    _user_cache[key] = user.model_dump(exclude={"password_hash"})
+    # Re-assign so the index entry always outlives the entries it points to
+    keys: Set[bytes] = _user_cache_keys.get(user.id, set())
+    keys.add(key)
+    _user_cache_keys[user.id] = keys
+
+
+def get_cached_user(token: str) -> Optional[UserModel]:
+    """Return a fresh transient copy of the cached user, if any"""
+    data = _user_cache.get(_token_cache_key(token))
+    if data is None:
+        return None
+    return UserModel(**data)
+
+
+def revoke_token(token: str) -> None:
+    """Drop the cached entry for a single token (call on logout)"""
+    _user_cache.pop(_token_cache_key(token), None)
+
+
+def revoke_user(user_id: str) -> None:
+    """Drop all cached entries for a user (call on role/active/profile changes)"""
+    for key in _user_cache_keys.pop(user_id, set()):
+        _user_cache.pop(key, None)
+
+
 async def authenticate_user(session: AsyncSession, email: str, password: str) -> Optional[UserModel]:
     """Authenticate user with email and password"""
-    statement = select(UserModel).where(UserModel.email == email, UserModel.is_active == True)
-    result = await session.execute(statement)
+    result = await session.execute(_active_user_by_email, {"email": email})
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(password, user.password_hash):
+    if not user:
+        # Constant-time miss: avoid a timing oracle on registered emails
+        await verify_password_async(password, await get_dummy_password_hash())
+        return None
+    
+    if not await verify_password_async(password, user.password_hash):
         return None
+    
+    # Lazily migrate hashes made with a different cost factor
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await get_password_hash_async(password)
+        await session.commit()
     return user
 
 
@@ -91,8 +228,11 @@ async def get_current_user(
             detail="Could not validate credentials"
         )
     
-    statement = select(UserModel).where(UserModel.id == user_id, UserModel.is_active == True)
-    result = await session.execute(statement)
+    cached_user = get_cached_user(token)
+    if cached_user is not None and cached_user.id == user_id:
+        return cached_user
+    
+    result = await session.execute(_active_user_by_id, {"user_id": user_id})
     user = result.scalar_one_or_none()
     
     if user is None:
@@ -101,16 +241,6 @@ async def get_current_user(
             detail="User not found"
         )
     
+    cache_user(token, user)
     return user
 
-
-def require_role(required_role: UserRole):
-    """Dependency to require specific user role"""
-    async def role_checker(current_user: UserModel = Depends(get_current_user)) -> UserModel:
-        if current_user.role != required_role:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required role: {required_role.value}"
-            )
-        return current_user
-    return role_checker
\ No newline at end of file
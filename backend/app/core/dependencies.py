@@ -1,6 +1,7 @@
 """
 Core Dependencies - Reusable dependency injection utilities
 """
+from functools import lru_cache
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,10 +17,12 @@ SessionDep = Annotated[AsyncSession, Depends(get_async_session)]
 CurrentUserDep = Annotated[UserModel, Depends(get_current_user)]
 
 
+@lru_cache(maxsize=None)
 def require_role(*roles: UserRole):
     """
     Dependency factory to require specific roles
     Usage: dependencies=[Depends(require_role(UserRole.HR))]
+    The same role set always returns the same checker, so FastAPI resolves it once per request
     """
     async def role_checker(current_user: CurrentUserDep) -> UserModel:
         if current_user.role not in roles:
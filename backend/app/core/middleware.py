@@ -0,0 +1,219 @@
+"""
+ASGI middleware for the HR Onboarding System
+"""
+import hashlib
+from typing import Iterable, Optional
+
+from cachetools import TTLCache
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ResponseCacheMiddleware:
+    """
+    Short-lived in-memory cache for read-heavy GET endpoints.
+
+    Entries are keyed by path, query string and a hash of the Authorization
+    header, so a user only ever receives responses generated for their own
+    token. Any successful write under `invalidate_paths` clears the cache.
+    The cache is per process; each worker keeps its own copy.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        invalidate_paths: Iterable[str],
+        ttl: int = 30,
+        maxsize: int = 1024
+    ):
+        self.app = app
+        self.paths = tuple(paths)
+        self.invalidate_paths = tuple(invalidate_paths)
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if scope["method"] != "GET":
+            if path.startswith(self.invalidate_paths):
+                await self._call_and_invalidate(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+            return
+
+        key = self._cache_key(scope) if path.startswith(self.paths) else None
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            status_code, headers, body = cached
+            await send({"type": "http.response.start", "status": status_code, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self._call_and_store(key, scope, receive, send)
+
+    @staticmethod
+    def _cache_key(scope: Scope) -> Optional[tuple]:
+        """Cache key for an authenticated request, None if unauthenticated"""
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+        if authorization is None:
+            return None
+        return (
+            scope["path"],
+            scope["query_string"],
+            hashlib.sha256(authorization).digest()
+        )
+
+    async def _call_and_store(self, key: tuple, scope: Scope, receive: Receive, send: Send) -> None:
+        """Forward the request and cache a successful response body"""
+        start_message: dict = {}
+        body_parts: list = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start_message.update(message)
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+                if not message.get("more_body", False) and start_message.get("status") == 200:
+                    self._cache[key] = (
+                        200,
+                        list(start_message.get("headers", [])),
+                        b"".join(body_parts)
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _call_and_invalidate(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Forward a write request and drop cached responses if it succeeded"""
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                self._cache.clear()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ETagMiddleware:
+    """
+    Adds a weak ETag to successful GET responses under `paths` and answers
+    a matching If-None-Match with an empty 304 Not Modified.
+
+    The ETag is a BLAKE2b digest of the uncompressed body. It is weak because
+    GZipMiddleware sits outside and the gzip and identity bytes differ, and
+    If-None-Match is compared weakly. Polling clients skip the download
+    whenever the data has not changed.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]):
+        self.app = app
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+                break
+
+        start_message: dict = {}
+        body_parts: list = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                # Hold the headers back until the whole body has been hashed
+                start_message.update(message)
+                return
+
+            if message["type"] != "http.response.body" or not start_message:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            opaque_tag = b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+            headers = [
+                (name, value) for name, value in start_message.get("headers", [])
+                if name != b"etag"
+            ]
+            headers.append((b"etag", b"W/" + opaque_tag))
+
+            if if_none_match is not None and _weak_match(if_none_match, opaque_tag):
+                headers = [
+                    (name, value) for name, value in headers
+                    if name not in (b"content-length", b"content-type")
+                ]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _weak_match(if_none_match: bytes, opaque_tag: bytes) -> bool:
+    """Weak comparison of an If-None-Match header against an entity tag (W/ prefixes ignored)"""
+    for tag in if_none_match.split(b","):
+        tag = tag.strip()
+        if tag == b"*":
+            return True
+        if tag.startswith(b"W/"):
+            tag = tag[2:]
+        if tag == opaque_tag:
+            return True
+    return False
+
+
+class MaxBodySizeMiddleware:
+    """
+    Rejects requests whose declared Content-Length exceeds the limit for
+    `paths` before the body is read or spooled to a temporary file.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str], max_body_size: int):
+        self.app = app
+        self.paths = tuple(paths)
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.paths):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = JSONResponse(
+                            {"detail": "File size exceeds maximum"},
+                            status_code=413
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,52 @@
+"""
+In-memory fixed-window rate limiting
+"""
+import os
+import time
+from typing import Hashable
+
+from cachetools import TTLCache
+from fastapi import HTTPException, status
+
+
+class RateLimiter:
+    """
+    Counts hits per key in fixed time windows.
+    State is per process, which bounds the bcrypt work any single worker
+    can be made to do.
+    """
+
+    def __init__(self, limit: int, window_seconds: int, maxsize: int = 100_000):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._hits: TTLCache = TTLCache(maxsize=maxsize, ttl=window_seconds)
+
+    def hit(self, key: Hashable) -> bool:
+        """Record a hit and return False once the key is over its limit"""
+        bucket_key = (key, int(time.time() // self.window_seconds))
+        count = self._hits.get(bucket_key, 0) + 1
+        self._hits[bucket_key] = count
+        return count <= self.limit
+
+    def enforce(self, key: Hashable) -> None:
+        """Record a hit and raise 429 once the key is over its limit"""
+        if not self.hit(key):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts. Please try again later.",
+                headers={"Retry-After": str(self.window_seconds)}
+            )
+
+
+# Login: 5/minute per client IP and 10/5 minutes per email
+login_ip_limiter = RateLimiter(
+    limit=int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", "5")),
+    window_seconds=60
+)
+login_email_limiter = RateLimiter(
+    limit=int(os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", "10")),
+    window_seconds=300
+)
+
+# Register: 10/minute per client IP
+register_ip_limiter = RateLimiter(limit=10, window_seconds=60)
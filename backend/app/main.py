@@ -2,10 +2,15 @@
 FastAPI HR Onboarding System - Clean Architecture Main Application
 Refactored with Service Layer, Dependency Injection, and Router Separation
 """
+import os
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .database import create_db_and_tables
+from .core.middleware import ResponseCacheMiddleware, ETagMiddleware, MaxBodySizeMiddleware
+from .services.document_service import MAX_FILE_SIZE
 from .routers import (
     auth_router,
     dashboard_router,
@@ -22,7 +27,42 @@ from .routers import (
 app = FastAPI(
     title="HR Onboarding System",
     version="3.0.0",
-    description="Clean Architecture HR Onboarding System with Service Layer & Dependency Injection"
+    description="Clean Architecture HR Onboarding System with Service Layer & Dependency Injection",
+    # orjson encodes responses (including datetimes) far faster than json.dumps
+    default_response_class=ORJSONResponse
+)
+
+# Response cache for polled read endpoints - added before CORS so CORS stays
+# outermost and cached bodies never carry another origin's CORS headers
+app.add_middleware(
+    ResponseCacheMiddleware,
+    paths=["/api/dashboard", "/api/employees", "/api/training", "/api/tasks"],
+    invalidate_paths=[
+        "/api/dashboard",
+        "/api/employees",
+        "/api/training",
+        "/api/tasks",
+        "/api/documents",
+        "/api/onboarding",
+        "/api/auth/register"
+    ],
+    ttl=int(os.getenv("RESPONSE_CACHE_TTL", "30"))
+)
+
+# ETag / 304 for the polled employee listings - wraps the response cache so
+# cached bodies are also answered with 304 when unchanged
+app.add_middleware(ETagMiddleware, paths=["/api/employees"])
+
+# Compress JSON bodies (lists repeat the same keys per row); small bodies and
+# empty 304s are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Reject oversize uploads from Content-Length before the body is read
+# (small allowance for the multipart form fields around the file)
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    paths=["/api/documents/upload"],
+    max_body_size=MAX_FILE_SIZE + 64 * 1024
 )
 
 # CORS middleware configuration
@@ -59,13 +99,24 @@ async def on_startup():
     """
     from .models.user import UserModel
     from .core.enums import UserRole
-    from .auth import get_password_hash
+    from .auth import get_password_hash_async, get_dummy_password_hash
     from .database import AsyncSessionLocal
+    from .utils.hashing import sha_extensions_available
     from sqlmodel import select
+    from sqlalchemy import insert
+    from sqlalchemy.exc import IntegrityError
     
     # Create database tables
     await create_db_and_tables()
     
+    # Precompute the unknown-email dummy hash before the first login
+    await get_dummy_password_hash()
+    
+    if sha_extensions_available():
+        print("✓ CPU SHA extensions available - upload hashing is hardware accelerated")
+    else:
+        print("✓ CPU SHA extensions not detected - upload hashing uses software SHA-256")
+    
     # Seed default users if not exists
     async with AsyncSessionLocal() as session:
         hr_stmt = select(UserModel).where(UserModel.email == "john.hr@company.com")
@@ -77,16 +128,21 @@ async def on_startup():
             print("🔧 Creating default users...")
             print("="*50)
             
-            # Create HR user
-            hr_user = UserModel(
-                name="John HR",
-                email="john.hr@company.com",
-                password_hash=get_password_hash("password123"),
-                role=UserRole.HR
-            )
-            session.add(hr_user)
+            # All default users share one password - hash it once
+            default_password_hash = await get_password_hash_async("password123")
             
-            # Create sample employees
+            # Build every default user first, then insert them in one executemany
+            # (model_dump applies the model's Python-side defaults such as id)
+            default_users = [
+                UserModel(
+                    name="John HR",
+                    email="john.hr@company.com",
+                    password_hash=default_password_hash,
+                    role=UserRole.HR
+                )
+            ]
+            
+            # Sample employees
             employees = [
                 ("Jane Employee", "jane.employee@company.com"),
                 ("Bob Employee", "bob.employee@company.com"),
@@ -94,15 +150,24 @@ async def on_startup():
             ]
             
             for name, email in employees:
-                employee = UserModel(
+                default_users.append(UserModel(
                     name=name,
                     email=email,
-                    password_hash=get_password_hash("password123"),
+                    password_hash=default_password_hash,
                     role=UserRole.EMPLOYEE
-                )
-                session.add(employee)
+                ))
             
-            await session.commit()
+            try:
+                await session.execute(
+                    insert(UserModel),
+                    [user.model_dump() for user in default_users]
+                )
+                await session.commit()
+            except IntegrityError:
+                # Another worker seeded the users first
+                await session.rollback()
+                print("✓ Default users already exist, skipping creation.")
+                return
             print("\n✅ Default users created successfully!")
             print("\n📋 Test Credentials:")
             print("   HR User:")
@@ -117,6 +182,17 @@ async def on_startup():
             print("✓ Default users already exist, skipping creation.")
 
 
+# Shutdown event - stop background worker pools
+@app.on_event("shutdown")
+async def on_shutdown():
+    """
+    Release process pools created during the app lifetime
+    """
+    from .auth import shutdown_password_pool
+    
+    shutdown_password_pool()
+
+
 # Health check endpoint
 @app.get("/", tags=["Health"])
 async def root():
@@ -2,30 +2,40 @@
 Document model definitions
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional
 from datetime import datetime
 import uuid
 
+from .types import uuid_primary_key, uuid_foreign_key
 from ..core.enums import DocumentType, VerificationStatus
 
 
 class DocumentModel(SQLModel, table=True):
     """Document database model"""
     __tablename__ = "documents"
+    __table_args__ = (
+        # Per-employee document lists filter on employee_id (and often verification_status)
+        Index("ix_docs_emp_vstatus", "employee_id", "verification_status"),
+        # Keyset pagination of the HR and per-employee document listings (newest first)
+        Index("ix_docs_uploaded_id", text("uploaded_at DESC"), text("id DESC")),
+        Index("ix_docs_emp_uploaded_id", "employee_id", text("uploaded_at DESC"), text("id DESC")),
+    )
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
-    employee_id: str = Field(foreign_key="users.id")
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), sa_column=uuid_primary_key())
+    employee_id: str = Field(sa_column=uuid_foreign_key("users.id"))
     document_type: DocumentType
     original_filename: str = Field(max_length=255)
     file_path: str = Field(max_length=500)
     file_size: Optional[int] = None
+    content_hash: Optional[str] = Field(default=None, max_length=64, index=True)  # SHA-256 hex
     mime_type: Optional[str] = Field(max_length=100)
-    verification_status: VerificationStatus = Field(default=VerificationStatus.PENDING)
+    verification_status: VerificationStatus = Field(default=VerificationStatus.PENDING, index=True)
     verification_notes: Optional[str] = None
-    verified_by: Optional[str] = Field(foreign_key="users.id")
+    verified_by: Optional[str] = Field(sa_column=uuid_foreign_key("users.id", nullable=True))
     verified_at: Optional[datetime] = None
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)
-    task_id: Optional[str] = Field(foreign_key="tasks.id")
+    task_id: Optional[str] = Field(sa_column=uuid_foreign_key("tasks.id", nullable=True))
     
     # AI fields
     extracted_text: Optional[str] = Field(default=None)
@@ -2,25 +2,31 @@
 Task model definitions
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional, List
 from datetime import datetime
 import uuid
 
+from .types import uuid_primary_key, uuid_foreign_key
 from ..core.enums import TaskType, TaskStatus, DocumentType
 
 
 class TaskModel(SQLModel, table=True):
     """Task database model"""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of the HR task listing (newest first)
+        Index("ix_tasks_created_id", text("created_at DESC"), text("id DESC")),
+    )
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), sa_column=uuid_primary_key())
     title: str = Field(max_length=200)
     description: Optional[str] = None
     task_type: TaskType
     content: Optional[str] = None  # For READ tasks
     required_document_type: Optional[DocumentType] = None  # For UPLOAD tasks
     is_active: bool = Field(default=True)
-    created_by: Optional[str] = Field(foreign_key="users.id")
+    created_by: Optional[str] = Field(sa_column=uuid_foreign_key("users.id", nullable=True))
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -33,12 +39,16 @@ class TaskModel(SQLModel, table=True):
 class EmployeeTaskModel(SQLModel, table=True):
     """Employee task assignment database model"""
     __tablename__ = "employee_tasks"
+    __table_args__ = (
+        # Per-employee task lists and stats filter on employee_id (and often status)
+        Index("ix_emp_task_emp_status", "employee_id", "status"),
+    )
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
-    employee_id: str = Field(foreign_key="users.id")
-    task_id: str = Field(foreign_key="tasks.id")
-    assigned_by: Optional[str] = Field(foreign_key="users.id")
-    status: TaskStatus = Field(default=TaskStatus.PENDING)
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), sa_column=uuid_primary_key())
+    employee_id: str = Field(sa_column=uuid_foreign_key("users.id"))
+    task_id: str = Field(sa_column=uuid_foreign_key("tasks.id"))
+    assigned_by: Optional[str] = Field(sa_column=uuid_foreign_key("users.id", nullable=True))
+    status: TaskStatus = Field(default=TaskStatus.PENDING, index=True)
     notes: Optional[str] = None
     assigned_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
@@ -2,10 +2,12 @@
 Training model definitions
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List
 from datetime import datetime
 import uuid
 
+from .types import uuid_primary_key, uuid_foreign_key
 from ..core.enums import TaskStatus
 
 
@@ -13,14 +15,14 @@ class TrainingModuleModel(SQLModel, table=True):
     """Training module database model"""
     __tablename__ = "training_modules"
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), sa_column=uuid_primary_key())
     title: str = Field(max_length=200)
     description: Optional[str] = None
     content: str
     duration_minutes: Optional[int] = None
     is_mandatory: bool = Field(default=False)
-    is_active: bool = Field(default=True)
-    created_by: Optional[str] = Field(foreign_key="users.id")
+    is_active: bool = Field(default=True, index=True)
+    created_by: Optional[str] = Field(sa_column=uuid_foreign_key("users.id", nullable=True))
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -32,10 +34,14 @@ class TrainingModuleModel(SQLModel, table=True):
 class EmployeeTrainingModel(SQLModel, table=True):
     """Employee training progress database model"""
     __tablename__ = "employee_training"
+    __table_args__ = (
+        # Progress lookups and the module LEFT JOIN filter on both columns
+        Index("ix_employee_training_employee_module", "employee_id", "training_module_id"),
+    )
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
-    employee_id: str = Field(foreign_key="users.id")
-    training_module_id: str = Field(foreign_key="training_modules.id")
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), sa_column=uuid_primary_key())
+    employee_id: str = Field(sa_column=uuid_foreign_key("users.id"))
+    training_module_id: str = Field(sa_column=uuid_foreign_key("training_modules.id"))
     status: TaskStatus = Field(default=TaskStatus.PENDING)
     progress_percentage: int = Field(default=0, ge=0, le=100)
     started_at: Optional[datetime] = None
@@ -0,0 +1,41 @@
+"""
+Shared column types for database models
+"""
+import uuid
+from sqlalchemy import Column, ForeignKey
+from sqlalchemy.types import TypeDecorator, Uuid
+
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+class UUIDString(TypeDecorator):
+    """
+    Native UUID column exposed to Python as a str.
+    Stored as a 16-byte uuid on PostgreSQL instead of a 36-char VARCHAR, so
+    PK/FK indexes and join keys are roughly half the size. Malformed ids bind
+    as the nil UUID, so lookups by a bad path parameter find nothing instead
+    of raising a database error.
+    """
+    impl = Uuid
+    cache_ok = True
+
+    def __init__(self):
+        super().__init__(as_uuid=False)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return NIL_UUID
+
+
+def uuid_primary_key() -> Column:
+    """UUID primary key column"""
+    return Column(UUIDString(), primary_key=True)
+
+
+def uuid_foreign_key(target: str, nullable: bool = False) -> Column:
+    """UUID foreign key column referencing `target` (e.g. "users.id")"""
+    return Column(UUIDString(), ForeignKey(target), nullable=nullable)
@@ -2,18 +2,26 @@
 User model definitions
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional, List
 from datetime import datetime
 import uuid
 
+from .types import uuid_primary_key
 from ..core.enums import UserRole, OnboardingStatus
 
 
 class UserModel(SQLModel, table=True):
     """User database model"""
     __tablename__ = "users"
+    __table_args__ = (
+        # Role listings and dashboard counts filter on role (and often is_active)
+        Index("ix_users_role_active", "role", "is_active"),
+        # Keyset pagination of the employee listing (newest first)
+        Index("ix_users_role_created_id", "role", text("created_at DESC"), text("id DESC")),
+    )
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), sa_column=uuid_primary_key())
     name: str = Field(max_length=100)
     email: str = Field(unique=True, max_length=255)
     password_hash: str = Field(max_length=255)
@@ -1,11 +1,14 @@
 """
 Authentication Router - Login, Register, Token Management
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.security import HTTPAuthorizationCredentials
 from typing import Annotated
 
 from ..core.dependencies import SessionDep, CurrentUserDep, require_role
+from ..core.rate_limit import login_ip_limiter, login_email_limiter, register_ip_limiter
 from ..services.auth_service import AuthService
+from ..auth import security, revoke_token
 from ..schemas.user import (
     UserLoginSchema, UserLoginResponseSchema,
     UserCreateSchema, UserResponseSchema
@@ -16,11 +19,20 @@ from ..core.enums import UserRole
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _client_ip(request: Request) -> str:
+    """Client address as seen by the server (set FORWARDED_ALLOW_IPS behind a proxy)"""
+    return request.client.host if request.client else "unknown"
+
+
 @router.post("/login", response_model=UserLoginResponseSchema)
-async def login(login_data: UserLoginSchema, session: SessionDep):
+async def login(login_data: UserLoginSchema, request: Request, session: SessionDep):
     """
     Authenticate user and return access token
     """
+    # Throttle before any DB lookup or bcrypt work
+    login_ip_limiter.enforce(_client_ip(request))
+    login_email_limiter.enforce(login_data.email.lower())
+    
     access_token, user = await AuthService.login_user(
         session,
         login_data.email,
@@ -30,7 +42,7 @@ async def login(login_data: UserLoginSchema, session: SessionDep):
     return UserLoginResponseSchema(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponseSchema.from_orm(user)
+        user=UserResponseSchema.model_validate(user)
     )
 
 
@@ -41,21 +53,27 @@ async def login(login_data: UserLoginSchema, session: SessionDep):
 )
 async def register_user(
     user_data: UserCreateSchema,
+    request: Request,
     session: SessionDep,
     current_user: CurrentUserDep
 ):
     """
     Register new user (HR only)
     """
+    register_ip_limiter.enforce(_client_ip(request))
     user = await AuthService.register_user(session, user_data, current_user.id)
-    return UserResponseSchema.from_orm(user)
+    return UserResponseSchema.model_validate(user)
 
 
 @router.post("/logout", response_model=MessageResponseSchema)
-async def logout(current_user: CurrentUserDep):
+async def logout(
+    current_user: CurrentUserDep,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
+):
     """
     Logout endpoint - client should discard token
     """
+    revoke_token(credentials.credentials)
     return {"message": "Logged out successfully"}
 
 
@@ -64,7 +82,7 @@ async def get_current_user_info(current_user: CurrentUserDep):
     """
     Get current authenticated user information
     """
-    return UserResponseSchema.from_orm(current_user)
+    return UserResponseSchema.model_validate(current_user)
 
 
 @router.get("/verify", response_model=MessageResponseSchema)
@@ -3,7 +3,7 @@ Documents Router - Document upload and management endpoints
 """
 from typing import Optional
 from pathlib import Path
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query
 import json
 
 from ..core.dependencies import SessionDep, CurrentUserDep
@@ -24,11 +24,13 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 async def get_documents(
     session: SessionDep,
     current_user: CurrentUserDep,
-    page: int = 1,
-    page_size: int = 50
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None
 ):
     """
     Get documents - HR sees all, Employee sees their own
+    Use next_cursor from the previous response as cursor for deep pages
     """
     document_service = DocumentService(UPLOAD_DIR)
     from ..core.enums import UserRole
@@ -38,7 +40,8 @@ async def get_documents(
         session,
         page=page,
         page_size=page_size,
-        employee_id=employee_id
+        employee_id=employee_id,
+        cursor=cursor
     )
 
 
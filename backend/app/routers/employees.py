@@ -1,9 +1,9 @@
 """
 Employees Router - Employee management endpoints
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import select
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 
 from ..core.dependencies import SessionDep, CurrentUserDep, require_role
@@ -21,6 +21,10 @@ from ..models.user import UserModel
 
 router = APIRouter(prefix="/api/employees", tags=["Employees"])
 
+# Constant delete payload serialized once. A fresh Response is built per call
+# because middleware may append headers to a response's header list.
+_DELETED_BODY = json.dumps({"message": "Employee deleted successfully"}).encode()
+
 
 @router.get(
     "/",
@@ -30,13 +34,15 @@ router = APIRouter(prefix="/api/employees", tags=["Employees"])
 async def get_all_employees(
     session: SessionDep,
     current_user: CurrentUserDep,
-    page: int = 1,
-    page_size: int = 50
+    cursor: Optional[str] = None,
+    page_size: int = Query(50, ge=1, le=200),
+    page: Optional[int] = Query(None, ge=1, deprecated=True)
 ):
     """
-    Get all employees with pagination (HR only)
+    Get all employees with cursor pagination (HR only)
+    Pass next_cursor from the previous response as cursor for the next page
     """
-    return await EmployeeService.get_all_employees(session, page, page_size)
+    return await EmployeeService.get_all_employees(session, page, page_size, cursor)
 
 
 @router.get(
@@ -70,7 +76,7 @@ async def update_employee(
     Update employee information (HR only)
     """
     employee = await EmployeeService.update_employee(session, employee_id, update_data)
-    return UserResponseSchema.from_orm(employee)
+    return UserResponseSchema.model_validate(employee)
 
 
 @router.delete(
@@ -87,7 +93,7 @@ async def delete_employee(
     Delete employee and all related records (HR only)
     """
     await EmployeeService.delete_employee(session, employee_id)
-    return {"message": "Employee deleted successfully"}
+    return Response(content=_DELETED_BODY, media_type="application/json")
 
 
 @router.get(
@@ -1,7 +1,8 @@
 """
 Tasks Router - Task management and assignment endpoints
 """
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
 from ..core.dependencies import SessionDep, CurrentUserDep, require_role
@@ -25,14 +26,16 @@ class CompleteTaskRequest(BaseModel):
 async def get_tasks(
     session: SessionDep,
     current_user: CurrentUserDep,
-    page: int = 1,
-    page_size: int = 50
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None
 ):
     """
     Get tasks - HR sees all tasks, Employee sees assigned tasks
+    HR can pass next_cursor from the previous response as cursor for deep pages
     """
     if current_user.role == UserRole.HR:
-        return await TaskService.get_all_tasks(session, page, page_size)
+        return await TaskService.get_all_tasks(session, page, page_size, cursor)
     else:
         return await TaskService.get_employee_tasks(session, current_user.id, page, page_size)
 
@@ -51,7 +54,7 @@ async def create_task(
     Create new task (HR only)
     """
     task = await TaskService.create_task(session, task_data, current_user.id)
-    return TaskResponseSchema.from_orm(task)
+    return TaskResponseSchema.model_validate(task)
 
 
 @router.put(
@@ -69,7 +72,7 @@ async def update_task(
     Update task (HR only)
     """
     task = await TaskService.update_task(session, task_id, update_data)
-    return TaskResponseSchema.from_orm(task)
+    return TaskResponseSchema.model_validate(task)
 
 
 @router.delete(
@@ -36,14 +36,18 @@ class EmployeeStatsSchema(BaseModel):
     total_tasks: int
     completed_tasks: int
     completion_rate: float
+    pending_documents: int = 0
+    total_training: int = 0
+    completed_training: int = 0
 
 
 class EmployeeListResponseSchema(BaseModel):
     """List of employees with pagination"""
     employees: List[EmployeeStatsSchema]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class EmployeeDetailSchema(BaseModel):
@@ -262,7 +262,6 @@ class AIDocumentService(BaseAIService):
                 document.ai_processed_at = datetime.utcnow()
                 session.add(document)
                 await session.commit()
-                await session.refresh(document)
                 return document
             
             # Step 2: Validate with AI
@@ -292,7 +291,6 @@ class AIDocumentService(BaseAIService):
             # Save to database
             session.add(document)
             await session.commit()
-            await session.refresh(document)
             
             return document
             
@@ -9,8 +9,9 @@ from fastapi import HTTPException, status
 
 from ..models.user import UserModel
 from ..schemas.user import UserCreateSchema
-from ..auth import authenticate_user, create_access_token, get_password_hash
+from ..auth import authenticate_user, create_access_token, get_password_hash_async, cache_user
 from ..core.enums import UserRole
+from .performance_service import PerformanceService
 
 
 class AuthService:
@@ -34,6 +35,7 @@ class AuthService:
             data={"sub": user.id, "role": user.role.value},
             expires_delta=access_token_expires
         )
+        cache_user(access_token, user)
         
         return access_token, user
     
@@ -58,7 +60,7 @@ class AuthService:
             )
         
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         db_user = UserModel(
             name=user_data.name,
             email=user_data.email,
@@ -69,7 +71,7 @@ class AuthService:
         
         session.add(db_user)
         await session.commit()
-        await session.refresh(db_user)
+        PerformanceService.invalidate_hr_dashboard()
         
         return db_user
     
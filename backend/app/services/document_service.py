@@ -1,8 +1,11 @@
 """
 Document Service - Handles document management business logic
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
+import os
+import uuid
+import hashlib
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
 from fastapi import UploadFile, HTTPException, status
@@ -11,6 +14,12 @@ import aiofiles
 from ..models.document import DocumentModel
 from ..core.enums import DocumentType, VerificationStatus
 from .ai_document_service import AIDocumentService
+from .performance_service import PerformanceService
+from ..utils.pagination import keyset_page
+
+# Upload limits - files are streamed to disk in chunks, never held whole in memory
+MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "10485760"))
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class DocumentService:
@@ -25,9 +34,10 @@ class DocumentService:
         session: AsyncSession,
         page: int = 1,
         page_size: int = 50,
-        employee_id: str = None
+        employee_id: str = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get paginated list of documents"""
+        """Get paginated list of documents, newest first"""
         # Build base query
         if employee_id:
             count_stmt = select(func.count()).select_from(DocumentModel).where(
@@ -44,10 +54,11 @@ class DocumentService:
         total_result = await session.execute(count_stmt)
         total = total_result.scalar()
         
-        # Get paginated documents
-        offset = (page - 1) * page_size
-        docs_result = await session.execute(docs_stmt.offset(offset).limit(page_size))
-        documents = docs_result.scalars().all()
+        # Get paginated documents (served by ix_docs_uploaded_id / ix_docs_emp_uploaded_id)
+        documents, next_cursor = await keyset_page(
+            session, docs_stmt, DocumentModel.uploaded_at, DocumentModel.id,
+            cursor, page_size, page
+        )
         
         return {
             "documents": [
@@ -63,7 +74,8 @@ class DocumentService:
             ],
             "total": total,
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": next_cursor
         }
     
     async def upload_document(
@@ -84,20 +96,61 @@ class DocumentService:
                 detail="Invalid document type"
             )
         
-        # Create file path
-        filename = f"{employee_id}_{doc_type.value}_{file.filename}"
-        file_path = self.upload_dir / filename
+        temp_path = self.upload_dir / f".{uuid.uuid4().hex}.part"
         
-        # Save file asynchronously
+        # Stream file to a temp path, counting bytes (file.size is not always set)
+        # and hashing as we go (OpenSSL SHA-256 uses SHA-NI where the CPU has it)
+        file_size = 0
+        hasher = hashlib.sha256()
         try:
-            async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
+            async with aiofiles.open(temp_path, 'wb') as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > MAX_FILE_SIZE:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail="File size exceeds maximum"
+                        )
+                    hasher.update(chunk)
+                    await f.write(chunk)
+        except HTTPException:
+            temp_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
+            temp_path.unlink(missing_ok=True)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"File upload failed: {str(e)}"
             )
+        content_hash = hasher.hexdigest()
+        
+        # Idempotent re-upload: the same file for the same employee, type and task
+        # returns the existing document. Failed or rejected documents are not
+        # reused so the employee can retry; a new row then points at the stored blob.
+        existing_stmt = select(DocumentModel).where(
+            DocumentModel.employee_id == employee_id,
+            DocumentModel.document_type == doc_type,
+            DocumentModel.content_hash == content_hash,
+            DocumentModel.task_id == task_id if task_id else DocumentModel.task_id.is_(None),
+            DocumentModel.verification_status.not_in(
+                [VerificationStatus.FAILED, VerificationStatus.REJECTED]
+            )
+        ).limit(1)
+        existing_result = await session.execute(existing_stmt)
+        existing_document = existing_result.scalar_one_or_none()
+        if existing_document:
+            temp_path.unlink(missing_ok=True)
+            return existing_document
+        
+        # Content-addressed storage: uploads/<hash[:2]>/<hash><ext>
+        # Identical content is stored once; the extension is kept for text extraction
+        suffix = Path(file.filename or "").suffix.lower()
+        file_path = self.upload_dir / content_hash[:2] / f"{content_hash}{suffix}"
+        if file_path.exists():
+            temp_path.unlink(missing_ok=True)
+        else:
+            file_path.parent.mkdir(exist_ok=True)
+            os.replace(temp_path, file_path)
         
         # Save document metadata
         document = DocumentModel(
@@ -105,14 +158,14 @@ class DocumentService:
             document_type=doc_type,
             original_filename=file.filename,
             file_path=str(file_path),
-            file_size=file.size,
+            file_size=file_size,
+            content_hash=content_hash,
             mime_type=file.content_type,
             task_id=task_id
         )
         
         session.add(document)
         await session.commit()
-        await session.refresh(document)
         
         # Process with AI asynchronously
         try:
@@ -120,6 +173,8 @@ class DocumentService:
         except Exception as e:
             print(f"AI processing failed for document {document.id}: {e}")
         
+        # New pending document (or AI verdict) changes the HR pending count
+        PerformanceService.invalidate_hr_dashboard()
         return document
     
     async def verify_document(
@@ -143,6 +198,6 @@ class DocumentService:
             document.verified_at = datetime.utcnow()
         
         await session.commit()
-        await session.refresh(document)
+        PerformanceService.invalidate_hr_dashboard()
         
         return document
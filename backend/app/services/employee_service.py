@@ -3,8 +3,11 @@ Employee Service - Handles employee management business logic
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
+from sqlalchemy import Select, case
+from sqlalchemy.orm import raiseload
 from fastapi import HTTPException, status
 
 from ..models.user import UserModel
@@ -12,71 +15,153 @@ from ..models.task import EmployeeTaskModel
 from ..models.document import DocumentModel
 from ..models.training import EmployeeTrainingModel
 from ..schemas.user import UserUpdateSchema
-from ..core.enums import UserRole, TaskStatus
+from ..auth import revoke_user
+from ..database import fetch_scalars, fetch_rows
+from ..utils.pagination import keyset_page
+from .performance_service import PerformanceService
+from ..core.enums import UserRole, TaskStatus, VerificationStatus
 
 
 class EmployeeService:
     """Service for employee management operations"""
     
+    @staticmethod
+    def _employees_stmt() -> Select:
+        """Employee listing statement - only the listed columns, so rows skip ORM hydration"""
+        return select(
+            UserModel.id,
+            UserModel.name,
+            UserModel.email,
+            UserModel.is_active,
+            UserModel.created_at
+        ).where(UserModel.role == UserRole.EMPLOYEE)
+    
     @staticmethod
     async def get_all_employees(
         session: AsyncSession,
-        page: int = 1,
-        page_size: int = 50
+        page: Optional[int] = None,
+        page_size: int = 50,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get paginated list of all employees with statistics"""
-        # Get total count
-        count_stmt = select(func.count()).select_from(UserModel).where(
-            UserModel.role == UserRole.EMPLOYEE
+        """
+        Get list of all employees with statistics, newest first
+        page (offset pagination with a total count) is deprecated
+        """
+        total = None
+        if page is not None and not cursor:
+            # Deprecated offset path - keeps the total count for old clients
+            count_stmt = select(func.count()).select_from(UserModel).where(
+                UserModel.role == UserRole.EMPLOYEE
+            )
+            total_result = await session.execute(count_stmt)
+            total = total_result.scalar()
+        
+        # Served by ix_users_role_created_id
+        employees, next_cursor = await keyset_page(
+            session, EmployeeService._employees_stmt(), UserModel.created_at, UserModel.id,
+            cursor, page_size, page
+        )
+        
+        # Build employee data with statistics - one aggregate query per related
+        # table for the whole page, run concurrently on their own sessions
+        employee_ids = [employee.id for employee in employees]
+        task_stats, document_stats, training_stats = await asyncio.gather(
+            EmployeeService._get_task_stats_by_employee(employee_ids),
+            EmployeeService._get_document_stats_by_employee(employee_ids),
+            EmployeeService._get_training_stats_by_employee(employee_ids)
         )
-        total_result = await session.execute(count_stmt)
-        total = total_result.scalar()
-        
-        # Get paginated employees
-        offset = (page - 1) * page_size
-        employees_stmt = select(UserModel).where(
-            UserModel.role == UserRole.EMPLOYEE
-        ).offset(offset).limit(page_size)
-        employees_result = await session.execute(employees_stmt)
-        employees = employees_result.scalars().all()
-        
-        # Build employee data with statistics
         employee_data = []
         for employee in employees:
-            stats = await EmployeeService._get_employee_task_stats(session, employee.id)
+            employee_id = employee.id
+            stats = task_stats.get(employee_id, EmployeeService._task_stats(0, 0))
             employee_data.append({
-                "id": employee.id,
+                "id": employee_id,
                 "name": employee.name,
                 "email": employee.email,
                 "is_active": employee.is_active,
-                **stats
+                **stats,
+                "pending_documents": document_stats.get(employee_id, 0),
+                **training_stats.get(employee_id, {"total_training": 0, "completed_training": 0})
             })
         
         return {
             "employees": employee_data,
             "total": total,
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": next_cursor
         }
     
     @staticmethod
-    async def _get_employee_task_stats(session: AsyncSession, employee_id: str) -> Dict[str, Any]:
-        """Get task statistics for an employee"""
-        tasks_stmt = select(EmployeeTaskModel).where(
-            EmployeeTaskModel.employee_id == employee_id
-        )
-        tasks_result = await session.execute(tasks_stmt)
-        tasks = tasks_result.scalars().all()
-        
-        completed = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
-        total = len(tasks)
-        
+    def _task_stats(total: int, completed: int) -> Dict[str, Any]:
+        """Build the task statistics block for an employee"""
         return {
             "total_tasks": total,
             "completed_tasks": completed,
             "completion_rate": completed / total * 100 if total > 0 else 0
         }
     
+    @staticmethod
+    async def _get_task_stats_by_employee(employee_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get task statistics for several employees in a single GROUP BY query"""
+        if not employee_ids:
+            return {}
+        
+        stats_stmt = select(
+            EmployeeTaskModel.employee_id,
+            func.count().label("total"),
+            func.sum(
+                case((EmployeeTaskModel.status == TaskStatus.COMPLETED, 1), else_=0)
+            ).label("completed")
+        ).where(
+            EmployeeTaskModel.employee_id.in_(employee_ids)
+        ).group_by(EmployeeTaskModel.employee_id)
+        
+        return {
+            row.employee_id: EmployeeService._task_stats(row.total, row.completed or 0)
+            for row in await fetch_rows(stats_stmt)
+        }
+    
+    @staticmethod
+    async def _get_document_stats_by_employee(employee_ids: List[str]) -> Dict[str, int]:
+        """Get pending document counts for several employees in a single GROUP BY query"""
+        if not employee_ids:
+            return {}
+        
+        stats_stmt = select(
+            DocumentModel.employee_id,
+            func.count().label("pending")
+        ).where(
+            DocumentModel.employee_id.in_(employee_ids),
+            DocumentModel.verification_status == VerificationStatus.PENDING
+        ).group_by(DocumentModel.employee_id)
+        
+        return {row.employee_id: row.pending for row in await fetch_rows(stats_stmt)}
+    
+    @staticmethod
+    async def _get_training_stats_by_employee(employee_ids: List[str]) -> Dict[str, Dict[str, int]]:
+        """Get training progress counts for several employees in a single GROUP BY query"""
+        if not employee_ids:
+            return {}
+        
+        stats_stmt = select(
+            EmployeeTrainingModel.employee_id,
+            func.count().label("total"),
+            func.sum(
+                case((EmployeeTrainingModel.status == TaskStatus.COMPLETED, 1), else_=0)
+            ).label("completed")
+        ).where(
+            EmployeeTrainingModel.employee_id.in_(employee_ids)
+        ).group_by(EmployeeTrainingModel.employee_id)
+        
+        return {
+            row.employee_id: {
+                "total_training": row.total,
+                "completed_training": row.completed or 0
+            }
+            for row in await fetch_rows(stats_stmt)
+        }
+    
     @staticmethod
     async def get_employee_by_id(
         session: AsyncSession,
@@ -102,21 +187,21 @@ class EmployeeService:
         employee_id: str
     ) -> Dict[str, Any]:
         """Get detailed employee information including tasks and documents"""
-        employee = await EmployeeService.get_employee_by_id(session, employee_id)
-        
-        # Get employee's tasks
-        tasks_stmt = select(EmployeeTaskModel).where(
-            EmployeeTaskModel.employee_id == employee.id
+        # Only column data is serialized below - raiseload makes any accidental
+        # lazy relationship access fail loudly instead of issuing a query per row
+        tasks_stmt = select(EmployeeTaskModel).options(raiseload("*")).where(
+            EmployeeTaskModel.employee_id == employee_id
+        )
+        docs_stmt = select(DocumentModel).options(raiseload("*")).where(
+            DocumentModel.employee_id == employee_id
         )
-        tasks_result = await session.execute(tasks_stmt)
-        tasks = tasks_result.scalars().all()
         
-        # Get employee's documents
-        docs_stmt = select(DocumentModel).where(
-            DocumentModel.employee_id == employee.id
+        # Employee, tasks and documents are independent - fetch them concurrently
+        employee, tasks, documents = await asyncio.gather(
+            EmployeeService.get_employee_by_id(session, employee_id),
+            fetch_scalars(tasks_stmt),
+            fetch_scalars(docs_stmt)
         )
-        docs_result = await session.execute(docs_stmt)
-        documents = docs_result.scalars().all()
         
         return {
             "employee": {
@@ -177,7 +262,8 @@ class EmployeeService:
         
         employee.updated_at = datetime.utcnow()
         await session.commit()
-        await session.refresh(employee)
+        revoke_user(employee.id)
+        PerformanceService.invalidate_hr_dashboard()
         
         return employee
     
@@ -213,3 +299,5 @@ class EmployeeService:
         # Delete employee
         await session.delete(employee)
         await session.commit()
+        revoke_user(employee.id)
+        PerformanceService.invalidate_hr_dashboard()
@@ -64,39 +64,47 @@ class HRAssistantService(BaseAIService):
         
         if intent == "stuck_employees":
             # Get employees with blocked/in-progress status
+            # Only the summarised columns, capped in SQL rather than sliced in Python
             result = await session.execute(
-                select(UserModel)
+                select(UserModel.name, UserModel.onboarding_status, UserModel.onboarding_notes)
                 .where(cast(UserModel.onboarding_status, String).in_(['BLOCKED', 'IN_PROGRESS']))
+                .limit(20)
             )
-            employees = result.scalars().all()
+            employees = result.mappings().all()
             
             return {
                 "employees": [
                     {
-                        "name": emp.name,
-                        "status": emp.onboarding_status.value,
-                        "notes": emp.onboarding_notes or "No notes"
-                    } for emp in employees[:20]
+                        "name": emp["name"],
+                        "status": emp["onboarding_status"].value,
+                        "notes": emp["onboarding_notes"] or "No notes"
+                    } for emp in employees
                 ]
             }
         
         elif intent == "pending_documents":
             # Get pending documents
             result = await session.execute(
-                select(DocumentModel, UserModel)
+                select(
+                    UserModel.name,
+                    DocumentModel.document_type,
+                    DocumentModel.uploaded_at,
+                    DocumentModel.ai_confidence_score
+                )
                 .join(UserModel, DocumentModel.employee_id == UserModel.id)
                 .where(cast(DocumentModel.verification_status, String) == 'PENDING')
+                .limit(20)
             )
-            docs = result.all()
+            docs = result.mappings().all()
             
             return {
                 "pending_documents": [
                     {
-                        "employee_name": d[1].name,
-                        "document_type": d[0].document_type.value,
-                        "uploaded_at": str(d[0].uploaded_at),
-                        "ai_confidence": d[0].ai_confidence_score or 0
-                    } for d in docs[:20]
+                        "employee_name": d["name"],
+                        "document_type": d["document_type"].value,
+                        "uploaded_at": str(d["uploaded_at"]),
+                        "ai_confidence": d["ai_confidence_score"] or 0
+                    } for d in docs
                 ]
             }
         
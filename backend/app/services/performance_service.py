@@ -4,6 +4,8 @@ Performance Service - Handles performance metrics and analytics
 from typing import Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
+from sqlalchemy import case
+from cachetools import TTLCache
 
 from ..models.user import UserModel
 from ..models.task import EmployeeTaskModel
@@ -12,9 +14,20 @@ from ..models.document import DocumentModel
 from ..core.enums import UserRole, TaskStatus, VerificationStatus
 
 
+# HR dashboard counters are global and polled on every HR page load - serve
+# them from a short-lived per-process cache
+HR_DASHBOARD_CACHE_TTL_SECONDS = 15
+_hr_dashboard_cache: TTLCache = TTLCache(maxsize=1, ttl=HR_DASHBOARD_CACHE_TTL_SECONDS)
+
+
 class PerformanceService:
     """Service for performance metrics and analytics"""
     
+    @staticmethod
+    def invalidate_hr_dashboard() -> None:
+        """Drop cached HR dashboard counters (call after employee changes)"""
+        _hr_dashboard_cache.clear()
+    
     @staticmethod
     async def get_overall_performance(session: AsyncSession) -> Dict[str, Any]:
         """Get overall HR dashboard performance statistics"""
@@ -134,14 +147,17 @@ class PerformanceService:
             avg_task_completion_days = None
         
         # Get training statistics
-        training_stmt = select(EmployeeTrainingModel).where(
-            EmployeeTrainingModel.employee_id == employee_id
-        )
+        training_stmt = select(
+            func.count().label("total"),
+            func.sum(
+                case((EmployeeTrainingModel.status == TaskStatus.COMPLETED, 1), else_=0)
+            ).label("completed")
+        ).where(EmployeeTrainingModel.employee_id == employee_id)
         training_result = await session.execute(training_stmt)
-        trainings = training_result.scalars().all()
+        training_counts = training_result.one()
         
-        total_training = len(trainings)
-        completed_training = len([t for t in trainings if t.status == TaskStatus.COMPLETED])
+        total_training = training_counts.total
+        completed_training = training_counts.completed or 0
         training_completion_rate = (
             (completed_training / total_training * 100)
             if total_training > 0 else 0
@@ -168,46 +184,56 @@ class PerformanceService:
     ) -> Dict[str, Any]:
         """Get role-specific dashboard metrics"""
         if user_role.lower() == "hr":
-            # HR Dashboard
-            employees_stmt = select(UserModel).where(UserModel.role == UserRole.EMPLOYEE)
-            employees_result = await session.execute(employees_stmt)
-            total_employees = employees_result.scalars().all()
+            cached = _hr_dashboard_cache.get("hr")
+            if cached is not None:
+                return dict(cached)
             
-            pending_tasks_stmt = select(EmployeeTaskModel).where(
-                EmployeeTaskModel.status == TaskStatus.PENDING
+            # HR Dashboard - all three counters in one round trip
+            counts_stmt = select(
+                select(func.count()).select_from(UserModel).where(
+                    UserModel.role == UserRole.EMPLOYEE
+                ).scalar_subquery().label("total_employees"),
+                select(func.count()).select_from(EmployeeTaskModel).where(
+                    EmployeeTaskModel.status == TaskStatus.PENDING
+                ).scalar_subquery().label("pending_tasks"),
+                select(func.count()).select_from(DocumentModel).where(
+                    DocumentModel.verification_status == VerificationStatus.PENDING
+                ).scalar_subquery().label("pending_documents")
             )
-            pending_tasks_result = await session.execute(pending_tasks_stmt)
-            pending_tasks = pending_tasks_result.scalars().all()
+            counts_result = await session.execute(counts_stmt)
+            counts = counts_result.one()
             
-            pending_docs_stmt = select(DocumentModel).where(
-                DocumentModel.verification_status == VerificationStatus.PENDING
-            )
-            pending_docs_result = await session.execute(pending_docs_stmt)
-            pending_documents = pending_docs_result.scalars().all()
-            
-            return {
+            metrics = {
                 "role": "hr",
-                "total_employees": len(total_employees),
-                "pending_tasks": len(pending_tasks),
-                "pending_documents": len(pending_documents),
+                "total_employees": counts.total_employees,
+                "pending_tasks": counts.pending_tasks,
+                "pending_documents": counts.pending_documents,
                 "recent_activities": []
             }
+            _hr_dashboard_cache["hr"] = metrics
+            return dict(metrics)
         
         elif user_role.lower() == "employee":
             # Employee Dashboard
-            user_tasks_stmt = select(EmployeeTaskModel).where(
-                EmployeeTaskModel.employee_id == employee_id
-            )
-            user_tasks_result = await session.execute(user_tasks_stmt)
-            user_tasks = user_tasks_result.scalars().all()
+            counts_stmt = select(
+                func.count().label("total"),
+                func.sum(
+                    case((EmployeeTaskModel.status == TaskStatus.COMPLETED, 1), else_=0)
+                ).label("completed"),
+                func.sum(
+                    case((EmployeeTaskModel.status == TaskStatus.PENDING, 1), else_=0)
+                ).label("pending")
+            ).where(EmployeeTaskModel.employee_id == employee_id)
+            counts_result = await session.execute(counts_stmt)
+            counts = counts_result.one()
             
-            completed_tasks = [task for task in user_tasks if task.status == TaskStatus.COMPLETED]
-            pending_tasks = [task for task in user_tasks if task.status == TaskStatus.PENDING]
+            total_tasks = counts.total
+            completed_tasks = counts.completed or 0
             
             return {
                 "role": "employee",
-                "total_tasks": len(user_tasks),
-                "completed_tasks": len(completed_tasks),
-                "pending_tasks": len(pending_tasks),
-                "completion_rate": len(completed_tasks) / len(user_tasks) * 100 if user_tasks else 0
+                "total_tasks": total_tasks,
+                "completed_tasks": completed_tasks,
+                "pending_tasks": counts.pending or 0,
+                "completion_rate": completed_tasks / total_tasks * 100 if total_tasks else 0
             }
@@ -1,15 +1,19 @@
 """
 Task Service - Handles task management business logic
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
 from fastapi import HTTPException, status
 
 from ..models.task import TaskModel, EmployeeTaskModel
+from ..database import fetch_scalar, fetch_rows
+from ..utils.pagination import keyset_page
 from ..schemas.task import TaskCreateSchema, TaskUpdateSchema
 from ..core.enums import TaskStatus
+from .performance_service import PerformanceService
 
 
 class TaskService:
@@ -19,19 +23,21 @@ class TaskService:
     async def get_all_tasks(
         session: AsyncSession,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get paginated list of all tasks (HR view)"""
-        # Get total count
+        """Get paginated list of all tasks (HR view), newest first"""
         count_stmt = select(func.count()).select_from(TaskModel)
-        total_result = await session.execute(count_stmt)
-        total = total_result.scalar()
         
-        # Get paginated tasks
-        offset = (page - 1) * page_size
-        tasks_stmt = select(TaskModel).offset(offset).limit(page_size)
-        tasks_result = await session.execute(tasks_stmt)
-        tasks = tasks_result.scalars().all()
+        # Total count and page are independent - fetch them concurrently
+        # (the page is served by ix_tasks_created_id)
+        total, (tasks, next_cursor) = await asyncio.gather(
+            fetch_scalar(count_stmt),
+            keyset_page(
+                session, select(TaskModel), TaskModel.created_at, TaskModel.id,
+                cursor, page_size, page
+            )
+        )
         
         return {
             "tasks": [
@@ -46,7 +52,8 @@ class TaskService:
             ],
             "total": total,
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": next_cursor
         }
     
     @staticmethod
@@ -57,27 +64,26 @@ class TaskService:
         page_size: int = 50
     ) -> Dict[str, Any]:
         """Get paginated list of tasks assigned to an employee"""
-        # Get total count
         count_stmt = select(func.count()).select_from(EmployeeTaskModel).where(
             EmployeeTaskModel.employee_id == employee_id
         )
-        total_result = await session.execute(count_stmt)
-        total = total_result.scalar()
-        
-        # Get paginated employee tasks
         offset = (page - 1) * page_size
-        employee_tasks_stmt = select(EmployeeTaskModel).where(
+        # Join the task details in the same query instead of one lookup per assignment
+        employee_tasks_stmt = select(EmployeeTaskModel, TaskModel).join(
+            TaskModel, TaskModel.id == EmployeeTaskModel.task_id
+        ).where(
             EmployeeTaskModel.employee_id == employee_id
         ).offset(offset).limit(page_size)
-        employee_tasks_result = await session.execute(employee_tasks_stmt)
-        employee_tasks = employee_tasks_result.scalars().all()
-        
-        # Build task data with details
-        task_data = []
-        for emp_task in employee_tasks:
-            task = await session.get(TaskModel, emp_task.task_id)
-            if task:
-                task_data.append({
+        
+        # Total count and page are independent - fetch them concurrently
+        total, employee_tasks = await asyncio.gather(
+            fetch_scalar(count_stmt),
+            fetch_rows(employee_tasks_stmt)
+        )
+        
+        return {
+            "tasks": [
+                {
                     "assignment_id": emp_task.id,
                     "task_id": task.id,
                     "title": task.title,
@@ -87,10 +93,8 @@ class TaskService:
                     "status": emp_task.status.value,
                     "assigned_at": emp_task.assigned_at,
                     "completed_at": emp_task.completed_at
-                })
-        
-        return {
-            "tasks": task_data,
+                } for emp_task, task in employee_tasks
+            ],
             "total": total,
             "page": page,
             "page_size": page_size
@@ -115,7 +119,6 @@ class TaskService:
         
         session.add(new_task)
         await session.commit()
-        await session.refresh(new_task)
         
         return new_task
     
@@ -154,7 +157,6 @@ class TaskService:
         
         task.updated_at = datetime.utcnow()
         await session.commit()
-        await session.refresh(task)
         
         return task
     
@@ -174,6 +176,7 @@ class TaskService:
         # Delete task
         await session.delete(task)
         await session.commit()
+        PerformanceService.invalidate_hr_dashboard()
     
     @staticmethod
     async def assign_task_to_employee(
@@ -204,7 +207,7 @@ class TaskService:
         
         session.add(assignment)
         await session.commit()
-        await session.refresh(assignment)
+        PerformanceService.invalidate_hr_dashboard()
         
         return assignment
     
@@ -227,6 +230,6 @@ class TaskService:
         assignment.completed_at = datetime.utcnow()
         
         await session.commit()
-        await session.refresh(assignment)
+        PerformanceService.invalidate_hr_dashboard()
         
         return assignment
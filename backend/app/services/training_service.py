@@ -5,6 +5,7 @@ from typing import Dict, Any
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
+from sqlalchemy import case, and_
 from fastapi import HTTPException, status
 
 from ..models.training import TrainingModuleModel, EmployeeTrainingModel
@@ -31,56 +32,59 @@ class TrainingService:
         
         # Get paginated modules
         offset = (page - 1) * page_size
+        
+        if employee_id:
+            # Include employee progress - one LEFT JOIN instead of a lookup per module
+            modules_stmt = select(TrainingModuleModel, EmployeeTrainingModel).outerjoin(
+                EmployeeTrainingModel,
+                and_(
+                    EmployeeTrainingModel.training_module_id == TrainingModuleModel.id,
+                    EmployeeTrainingModel.employee_id == employee_id
+                )
+            ).where(
+                TrainingModuleModel.is_active == True
+            ).offset(offset).limit(page_size)
+            modules_result = await session.execute(modules_stmt)
+            
+            return TrainingService._build_employee_training_data(
+                modules_result.all(), total, page, page_size
+            )
+        
         modules_stmt = select(TrainingModuleModel).where(
             TrainingModuleModel.is_active == True
         ).offset(offset).limit(page_size)
         modules_result = await session.execute(modules_stmt)
         modules = modules_result.scalars().all()
         
-        if employee_id:
-            # Include employee progress
-            return await TrainingService._build_employee_training_data(
-                session, modules, employee_id, total, page, page_size
-            )
-        else:
-            # HR view - just modules
-            return {
-                "training_modules": [
-                    {
-                        "id": module.id,
-                        "title": module.title,
-                        "description": module.description,
-                        "content": module.content,
-                        "duration_minutes": module.duration_minutes,
-                        "is_mandatory": module.is_mandatory,
-                        "created_at": module.created_at
-                    } for module in modules
-                ],
-                "total": total,
-                "page": page,
-                "page_size": page_size
-            }
+        # HR view - just modules
+        return {
+            "training_modules": [
+                {
+                    "id": module.id,
+                    "title": module.title,
+                    "description": module.description,
+                    "content": module.content,
+                    "duration_minutes": module.duration_minutes,
+                    "is_mandatory": module.is_mandatory,
+                    "created_at": module.created_at
+                } for module in modules
+            ],
+            "total": total,
+            "page": page,
+            "page_size": page_size
+        }
     
     @staticmethod
-    async def _build_employee_training_data(
-        session: AsyncSession,
-        modules: list,
-        employee_id: str,
+    def _build_employee_training_data(
+        rows: list,
         total: int,
         page: int,
         page_size: int
     ) -> Dict[str, Any]:
-        """Build training data with employee progress"""
+        """Build training data from (module, progress-or-None) rows"""
         progress_data = []
         
-        for module in modules:
-            progress_stmt = select(EmployeeTrainingModel).where(
-                EmployeeTrainingModel.employee_id == employee_id,
-                EmployeeTrainingModel.training_module_id == module.id
-            )
-            progress_result = await session.execute(progress_stmt)
-            progress = progress_result.scalar_one_or_none()
-            
+        for module, progress in rows:
             progress_data.append({
                 "id": module.id,
                 "title": module.title,
@@ -143,7 +147,6 @@ class TrainingService:
                 progress.status = TaskStatus.PENDING
         
         await session.commit()
-        await session.refresh(progress)
         
         return progress
     
@@ -153,14 +156,17 @@ class TrainingService:
         employee_id: str
     ) -> Dict[str, Any]:
         """Get training statistics for an employee"""
-        training_stmt = select(EmployeeTrainingModel).where(
-            EmployeeTrainingModel.employee_id == employee_id
-        )
+        training_stmt = select(
+            func.count().label("total"),
+            func.sum(
+                case((EmployeeTrainingModel.status == TaskStatus.COMPLETED, 1), else_=0)
+            ).label("completed")
+        ).where(EmployeeTrainingModel.employee_id == employee_id)
         training_result = await session.execute(training_stmt)
-        trainings = training_result.scalars().all()
+        training_counts = training_result.one()
         
-        total_training = len(trainings)
-        completed_training = len([t for t in trainings if t.status == TaskStatus.COMPLETED])
+        total_training = training_counts.total
+        completed_training = training_counts.completed or 0
         training_completion_rate = (completed_training / total_training * 100) if total_training > 0 else 0
         
         return {
@@ -0,0 +1,44 @@
+"""
+bcrypt cost calibration
+
+Measures hashing time per cost factor on the current machine and prints
+the largest cost that fits the login latency budget. Run on production
+hardware and set BCRYPT_ROUNDS to the result:
+
+    python -m app.utils.bcrypt_speed [budget_ms]
+"""
+import sys
+import time
+import bcrypt
+
+DEFAULT_BUDGET_MS = 80.0
+MIN_ROUNDS = 8
+MAX_ROUNDS = 14
+SAMPLES = 5
+
+
+def measure_rounds(rounds: int, samples: int = SAMPLES) -> float:
+    """Mean time in milliseconds to hash one password at the given cost"""
+    salt = bcrypt.gensalt(rounds)
+    start = time.perf_counter()
+    for _ in range(samples):
+        bcrypt.hashpw(b"x", salt)
+    return (time.perf_counter() - start) / samples * 1000
+
+
+def pick_rounds(budget_ms: float = DEFAULT_BUDGET_MS) -> int:
+    """Largest cost factor whose mean hash time stays within the budget"""
+    best = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        mean_ms = measure_rounds(rounds)
+        print(f"rounds={rounds:2d}  mean={mean_ms:8.1f} ms")
+        if mean_ms > budget_ms:
+            break
+        best = rounds
+    return best
+
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    rounds = pick_rounds(budget)
+    print(f"\nBCRYPT_ROUNDS={rounds}  (budget {budget:.0f} ms)")
@@ -0,0 +1,20 @@
+"""
+Hashing capability checks
+"""
+
+
+def sha_extensions_available() -> bool:
+    """
+    Check whether the CPU exposes SHA-256 instructions (x86 SHA-NI or ARMv8 SHA2).
+    hashlib's OpenSSL backend uses them automatically when present.
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    cpu_flags = line.split(":", 1)[1].split()
+                    return "sha_ni" in cpu_flags or "sha2" in cpu_flags
+    except OSError:
+        # Not Linux or /proc unavailable
+        pass
+    return False
@@ -0,0 +1,97 @@
+"""
+Keyset (seek) pagination helpers
+"""
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+import base64
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Encode the (timestamp, id) seek position of the last row on a page"""
+    raw = f"{sort_value.isoformat()},{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor, 400 if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_value, row_id = raw.split(",", 1)
+        return datetime.fromisoformat(sort_value), str(uuid.UUID(row_id))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def seek_before(sort_column, id_column, sort_value: datetime, row_id: str):
+    """
+    Rows after the cursor for ORDER BY sort_column DESC, id_column DESC.
+    Written as column comparisons (not a row-value tuple) so each bind takes
+    its column's type - ids bind as uuid, not VARCHAR. The leading <= gives
+    the planner an index range on sort_column.
+    """
+    return and_(
+        sort_column <= sort_value,
+        or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < row_id)
+        )
+    )
+
+
+def keyset_stmt(
+    stmt: Select,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    page_size: int,
+    page: Optional[int] = None
+) -> Select:
+    """
+    Order stmt newest first on (sort_column, id_column) and select one page.
+    Seeks past cursor when given, otherwise falls back to OFFSET for page.
+    One extra row is fetched so keyset_page can tell whether another page exists.
+    """
+    stmt = stmt.order_by(sort_column.desc(), id_column.desc())
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        stmt = stmt.where(seek_before(sort_column, id_column, sort_value, row_id))
+    elif page:
+        stmt = stmt.offset((page - 1) * page_size)
+    return stmt.limit(page_size + 1)
+
+
+async def keyset_page(
+    session: AsyncSession,
+    stmt: Select,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    page_size: int,
+    page: Optional[int] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Run one keyset page of stmt and return (rows, next_cursor).
+    A single-entity select yields model instances, a column select yields rows;
+    next_cursor is None on the last page.
+    """
+    page_stmt = keyset_stmt(stmt, sort_column, id_column, cursor, page_size, page)
+    result = await session.execute(page_stmt)
+    descriptions = page_stmt.column_descriptions
+    if len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]:
+        rows = result.scalars().all()
+    else:
+        rows = result.all()
+
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -1,73 +1,12 @@
 """
 Main entry point for the HR Onboarding System
 """
-import asyncio
 import uvicorn
 import os
-from app.main import app
-from app.database import create_db_and_tables, AsyncSessionLocal
-from app.core.enums import UserRole
-from app.auth import get_password_hash
-
-async def create_default_users():
-    """Create default HR and employee users if they don't exist"""
-    from app.models.user import UserModel
-    from sqlmodel import select
-    
-    async with AsyncSessionLocal() as session:
-        # Check if HR user exists
-        hr_stmt = select(UserModel).where(UserModel.email == "john.hr@company.com")
-        result = await session.execute(hr_stmt)
-        hr_exists = result.scalar_one_or_none()
-        
-        if not hr_exists:
-            print("Creating default users...")
-            
-            # Create HR user
-            hr_user = UserModel(
-                name="John HR",
-                email="john.hr@company.com",
-                password_hash=get_password_hash("password123"),
-                role=UserRole.HR
-            )
-            session.add(hr_user)
-            
-            # Create sample employees
-            employees = [
-                ("Jane Employee", "jane.employee@company.com"),
-                ("Bob Employee", "bob.employee@company.com"),
-                ("Alice Employee", "alice.employee@company.com")
-            ]
-            
-            for name, email in employees:
-                employee = UserModel(
-                    name=name,
-                    email=email,
-                    password_hash=get_password_hash("password123"),
-                    role=UserRole.EMPLOYEE
-                )
-                session.add(employee)
-            
-            await session.commit()
-            print("✅ Default users created!")
-            print("   HR: john.hr@company.com / password123")
-            print("   Employees: jane.employee@company.com, bob.employee@company.com, alice.employee@company.com")
-            print("   Password for all: password123")
-        else:
-            print("Default users already exist, skipping creation.")
-
-async def startup():
-    """Initialize the application"""
-    print("Creating database tables...")
-    await create_db_and_tables()
-    print("Database tables created successfully!")
-    
-    # Create default users if they don't exist
-    await create_default_users()
 
 if __name__ == "__main__":
-    # Database initialization happens in app startup event
-    # No need to run it here to avoid event loop conflicts
+    # Database initialization and default users are handled by the
+    # app startup event in app/main.py
     
     # Start the server
     print("Starting FastAPI server...")
@@ -75,10 +14,28 @@ if __name__ == "__main__":
     # Get port from environment (for cloud platforms like Render, Railway)
     port = int(os.getenv("PORT", 8000))
     
+    # Auto-reload only for local development (DEV=1); it is single-process
+    reload = os.getenv("DEV") == "1"
+    
+    # uvicorn's default loop/http="auto" picks uvloop + httptools (the C event loop
+    # and HTTP parser from uvicorn[standard]) where installed - uvloop is not on Windows
+    options = {}
+    if not reload:
+        # Single worker unless WEB_CONCURRENCY is set: the user/response caches,
+        # revocation and login rate limits are per process (see README)
+        options["workers"] = int(os.getenv("WEB_CONCURRENCY", "1"))
+    
+    # Trust X-Forwarded-For only from these proxies so login rate limits see the
+    # real client IP (set to "*" behind the Render/Railway load balancer)
+    forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+    
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=False,  # Disable reload in production
-        log_level="info"
-    )
\ No newline at end of file
+        reload=reload,
+        proxy_headers=True,
+        forwarded_allow_ips=forwarded_allow_ips,
+        log_level="info",
+        **options
+    )
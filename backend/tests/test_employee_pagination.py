@@ -0,0 +1,46 @@
+"""
+Employee listing keyset pagination
+"""
+from datetime import datetime
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.models.types import UUIDString
+from app.models.user import UserModel
+from app.services.employee_service import EmployeeService
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_stmt
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 14, 9, 30, 15, 123456)
+    employee_id = str(uuid.uuid4())
+
+    assert decode_cursor(encode_cursor(created_at, employee_id)) == (created_at, employee_id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!",
+    encode_cursor(datetime(2026, 10, 14), "not-a-uuid"),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+def test_page_two_binds_cursor_id_as_uuid():
+    """next_cursor from page 1 must compare as uuid against users.id on PostgreSQL"""
+    last_row_id = str(uuid.uuid4())
+    next_cursor = encode_cursor(datetime(2026, 10, 14, 9, 30), last_row_id)
+
+    page_two = keyset_stmt(
+        EmployeeService._employees_stmt(), UserModel.created_at, UserModel.id, next_cursor, 50
+    )
+    compiled = page_two.compile(dialect=asyncpg.dialect())
+    id_binds = [bind for bind in compiled.binds.values() if bind.value == last_row_id]
+
+    assert id_binds
+    assert all(isinstance(bind.type, UUIDString) for bind in id_binds)
@@ -0,0 +1,46 @@
+"""
+Employee changes evict the user cache
+"""
+import asyncio
+import uuid
+
+from app.auth import cache_user, get_cached_user
+from app.core.enums import UserRole
+from app.models.user import UserModel
+from app.schemas.user import UserUpdateSchema
+from app.services.employee_service import EmployeeService
+
+
+class _LoadedRowSession:
+    """Session stand-in that returns an already-loaded row, as session.get does for any id spelling"""
+
+    def __init__(self, row: UserModel):
+        self.row = row
+
+    async def get(self, model, ident):
+        return self.row
+
+    async def commit(self):
+        pass
+
+
+def test_deactivate_through_non_canonical_id_revokes_cached_user():
+    employee = UserModel(
+        id=str(uuid.uuid4()),
+        name="Jane Employee",
+        email="jane.employee@company.com",
+        password_hash="x",
+        role=UserRole.EMPLOYEE
+    )
+    token = "token-for-jane"
+    cache_user(token, employee)
+
+    non_canonical_id = employee.id.upper().replace("-", "")
+    asyncio.run(EmployeeService.update_employee(
+        _LoadedRowSession(employee),
+        non_canonical_id,
+        UserUpdateSchema(is_active=False)
+    ))
+
+    assert employee.is_active is False
+    assert get_cached_user(token) is None